@@ -5,7 +5,7 @@ from sqlalchemy import pool
 
 from alembic import context
 from sqlalchemy.ext.asyncio import async_engine_from_config
-from models import *  # noqa
+from src.models import *  # noqa
 from sqlmodel import SQLModel
 
 # this is the Alembic Config object, which provides
@@ -0,0 +1,37 @@
+"""add_message_chat_timestamp_index
+
+Revision ID: 00c3a5418ec7
+Revises: bbba88e22126
+Create Date: 2026-08-29 10:22:03.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "00c3a5418ec7"
+down_revision: Union[str, None] = "bbba88e22126"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Covering index for the summarize/context queries: they filter on
+    # chat_jid + timestamp range, order by timestamp DESC with a LIMIT, and
+    # read only sender_jid/text - INCLUDE lets Postgres answer them from the
+    # index alone. Table size is bounded by the per-group cleanup trigger, so
+    # including the text payload is cheap.
+    op.create_index(
+        "idx_message_chat_timestamp",
+        "message",
+        ["chat_jid", sa.text("timestamp DESC")],
+        postgresql_include=["sender_jid", "text"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("idx_message_chat_timestamp", table_name="message")
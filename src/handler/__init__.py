@@ -8,6 +8,11 @@ from sqlmodel.ext.asyncio.session import AsyncSession
 from voyageai.client_async import AsyncClient
 
 from src.handler.base_handler import BaseHandler
+from src.handler.group_utils import (
+    extract_phone_from_participant,
+    get_group_by_jid,
+    get_user_groups,
+)
 from src.handler.router import Router
 from src.load_new_kbtopics import topicsLoader
 from src.models.group import Group
@@ -25,32 +30,6 @@ ADMIN_USER = "972532741041"
 
 allow_participants_interactions = False
 
-async def get_user_groups(whatsapp: WhatsAppClient):
-    """Get user groups - single attempt only"""
-    try:
-        return await whatsapp.get_user_groups()
-    except Exception as e:
-        logger.error(f"Error fetching groups: {e}")
-        raise
-
-
-def extract_phone_from_participant(participant):
-    """Extract phone number from participant data"""
-    try:
-        # Try to get PhoneNumber directly from the model
-        if participant.PhoneNumber:
-            phone = participant.PhoneNumber
-            # Extract phone number from format "972585277785@s.whatsapp.net"
-            return phone.split('@')[0] if '@' in phone else phone
-        
-        # No fallback - return None if no phone number found
-        return None
-        
-    except Exception as e:
-        logger.warning(f"Error extracting phone from participant: {e}")
-        return None
-
-
 class MessageHandler(BaseHandler):
     def __init__(
         self,
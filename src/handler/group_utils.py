@@ -0,0 +1,54 @@
+import logging
+import time
+
+from src.whatsapp.client import WhatsAppClient
+
+logger = logging.getLogger(__name__)
+
+# Group membership changes rarely; cache the list briefly per client so every
+# @כולם message doesn't trigger a fresh group-list fetch. Alongside the raw
+# response we keep a JID -> group index for O(1) single-group lookups.
+GROUPS_CACHE_TTL_SECONDS = 60.0
+_groups_cache: dict[WhatsAppClient, tuple[float, object, dict[str, object]]] = {}
+
+
+async def get_user_groups(whatsapp: WhatsAppClient):
+    """Get user groups - single attempt only, cached for a short TTL"""
+    cached = _groups_cache.get(whatsapp)
+    if cached is not None and time.monotonic() - cached[0] < GROUPS_CACHE_TTL_SECONDS:
+        return cached[1]
+    try:
+        groups = await whatsapp.get_user_groups()
+    except Exception as e:
+        logger.error(f"Error fetching groups: {e}")
+        raise
+    data = groups.results.data if (groups.results and groups.results.data) else []
+    _groups_cache[whatsapp] = (
+        time.monotonic(),
+        groups,
+        {group.JID: group for group in data},
+    )
+    return groups
+
+
+async def get_group_by_jid(whatsapp: WhatsAppClient, jid: str):
+    """Resolve a single group by JID from the cached list, or None."""
+    await get_user_groups(whatsapp)  # Refresh the cache if stale
+    return _groups_cache[whatsapp][2].get(jid)
+
+
+def extract_phone_from_participant(participant):
+    """Extract phone number from participant data"""
+    try:
+        # Try to get PhoneNumber directly from the model
+        if participant.PhoneNumber:
+            phone = participant.PhoneNumber
+            # Extract phone number from format "972585277785@s.whatsapp.net"
+            return phone.split('@')[0] if '@' in phone else phone
+
+        # No fallback - return None if no phone number found
+        return None
+
+    except Exception as e:
+        logger.warning(f"Error extracting phone from participant: {e}")
+        return None
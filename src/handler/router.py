@@ -3,7 +3,7 @@ from datetime import datetime, timedelta, date, time, timezone
 from enum import Enum
 from typing import Any, Dict, Optional
 
-import os, re, json, base64, asyncio
+import os, re, json, base64, asyncio, threading
 from zoneinfo import ZoneInfo
 
 from pydantic import BaseModel, Field
@@ -12,6 +12,7 @@ from sqlmodel import desc, select
 from sqlmodel.ext.asyncio.session import AsyncSession
 from voyageai.client_async import AsyncClient
 
+from src.handler.group_utils import extract_phone_from_participant, get_group_by_jid
 from src.handler.knowledge_base_answers import KnowledgeBaseAnswers
 from src.models import Message
 from src.models.group import Group
@@ -28,15 +29,32 @@ logger = logging.getLogger(__name__)
 TZ = ZoneInfo("Asia/Jerusalem")  # Global timezone
 MAX_MESSAGES_FOR_CONTEXT = 200  # Bound context upstream in SQL
 MAX_HISTORY_CHARS = 12000       # ~3k tokens approximation (4 chars/token)
+MAX_RESPONSE_CHARS = 4000       # WhatsApp caps outgoing messages at ~4096 chars
+TRUNCATION_NOTICE = "...\n\n[Response truncated due to length]"
 HISTORY_PROCESSING_NOTIFY_THRESHOLD = 50
+HANDLER_TIMEOUT_SECONDS = 300  # Per-intent handler budget, matches the httpx timeout
 DEFAULT_DUE_HOUR = 10
 DEFAULT_DUE_MINUTE = 0
+DEFAULT_DUE_TIME = time(hour=DEFAULT_DUE_HOUR, minute=DEFAULT_DUE_MINUTE)
+MIDNIGHT = datetime.min.time()  # Start-of-day marker for "today" queries
 TARGET_TASK_LIST_NAME = "WhatsApp tasks"
 SUMMARIZE_MODEL = "anthropic:claude-4-sonnet-20250514"
 
 # Google Tasks integration helpers
 SCOPES = ["https://www.googleapis.com/auth/tasks"]
 
+# Task date/time patterns, compiled once at import instead of per message.
+# One combined scanner finds both the first date (DD.MM / DD/MM, optional 2- or
+# 4-digit year) and the first time (HH:MM, 24h) in a single pass over the text
+DUE_RE = re.compile(
+    r"\b(?P<day>\d{1,2})[./](?P<month>\d{1,2})(?:[./](?P<year>\d{2,4}))?\b"
+    r"|\b(?P<hour>[01]?\d|2[0-3]):(?P<minute>[0-5]\d)\b"
+)
+# Same patterns with surrounding whitespace, for stripping them from titles
+DATE_STRIP_RE = re.compile(r"\s*\b\d{1,2}[./]\d{1,2}(?:[./]\d{2,4})?\b\s*")
+TIME_STRIP_RE = re.compile(r"\s*\b([01]?\d|2[0-3]):([0-5]\d)\b\s*")
+WHITESPACE_RE = re.compile(r"\s+")
+
 def load_google_tasks_credentials():
     """Load Google OAuth credentials from base64 env variable only."""
     # Lazy import to avoid hard dependency during test collection or when tasks feature isn't used
@@ -47,28 +65,57 @@ def load_google_tasks_credentials():
     data = json.loads(base64.b64decode(b64).decode())
     return Credentials.from_authorized_user_info(data, SCOPES)
 
+# Built once and reused: service construction re-decodes the credentials and
+# builds the discovery client on every call otherwise. The service shares one
+# authorized httplib2.Http, which is not thread-safe, and asyncio.to_thread
+# runs on a pool - a tasklist lookup can overlap the batch worker - so every
+# use of the service must hold _tasks_service_lock.
+_tasks_service = None
+_tasks_service_lock = threading.Lock()
+# Tasklist IDs are stable per account; remember successful name lookups
+_tasklist_id_cache: Dict[str, str] = {}
+
 def get_tasks_service():
     # Lazy import to avoid hard dependency during test collection or when tasks feature isn't used
-    from googleapiclient.discovery import build  # type: ignore[import-not-found]
-    creds = load_google_tasks_credentials()
-    return build("tasks", "v1", credentials=creds, cache_discovery=False)
+    global _tasks_service
+    if _tasks_service is None:
+        from googleapiclient.discovery import build  # type: ignore[import-not-found]
+        creds = load_google_tasks_credentials()
+        # static_discovery reads the tasks/v1 discovery doc bundled with the
+        # client library from disk instead of fetching it over HTTP
+        _tasks_service = build(
+            "tasks",
+            "v1",
+            credentials=creds,
+            cache_discovery=False,
+            static_discovery=True,
+        )
+    return _tasks_service
 
 def _get_tasklist_id_by_name_sync(name: str) -> Optional[str]:
     """Return Google Tasks list ID by its title, or None if not found."""
-    svc = get_tasks_service()
-    page_token: Optional[str] = None
-    while True:
-        resp = (
-            svc.tasklists()
-            .list(maxResults=100, pageToken=page_token)
-            .execute()
-        )
-        for tasklist in resp.get("items", []) or []:
-            if tasklist.get("title") == name:
-                return tasklist.get("id")
-        page_token = resp.get("nextPageToken")
-        if not page_token:
-            break
+    cached = _tasklist_id_cache.get(name)
+    if cached is not None:
+        return cached
+    with _tasks_service_lock:
+        svc = get_tasks_service()
+        page_token: Optional[str] = None
+        while True:
+            resp = (
+                svc.tasklists()
+                .list(maxResults=100, pageToken=page_token)
+                .execute()
+            )
+            for tasklist in resp.get("items", []) or []:
+                if tasklist.get("title") == name:
+                    list_id = tasklist.get("id")
+                    if list_id:
+                        # Only hits are cached, so a list created later is still found
+                        _tasklist_id_cache[name] = list_id
+                    return list_id
+            page_token = resp.get("nextPageToken")
+            if not page_token:
+                break
     return None
 
 def _parse_task(text: str):
@@ -87,11 +134,11 @@ def _parse_task(text: str):
     
     # Find and remove date/time patterns, but preserve surrounding text
     # Remove date patterns (DD.MM, DD/MM, DD.MM.YY, etc.) with surrounding whitespace
-    title = re.sub(r"\s*\b\d{1,2}[./]\d{1,2}(?:[./]\d{2,4})?\b\s*", " ", title)
+    title = DATE_STRIP_RE.sub(" ", title)
     # Remove time patterns (HH:MM) with surrounding whitespace
-    title = re.sub(r"\s*\b([01]?\d|2[0-3]):([0-5]\d)\b\s*", " ", title)
+    title = TIME_STRIP_RE.sub(" ", title)
     # Clean up extra whitespace but preserve the structure
-    title = re.sub(r"\s+", " ", title).strip()
+    title = WHITESPACE_RE.sub(" ", title).strip()
     
     return title or None
 
@@ -109,32 +156,48 @@ def _parse_due_datetime(text: str, tz) -> Optional[datetime]:
     if not text:
         return None
 
-    logger.info(f"due_parse start: text='{text}'")
-    date_match = re.search(r"\b(\d{1,2})[./](\d{1,2})(?:[./](\d{2,4}))?\b", text)
-    time_match = re.search(r"\b([01]?\d|2[0-3]):([0-5]\d)\b", text)
+    logger.debug("due_parse start: text='%s'", text)
+    # One pass over the text collects the first date and first time hit
+    date_match = time_match = None
+    for hit in DUE_RE.finditer(text):
+        if hit.group("day") is not None:
+            date_match = date_match or hit
+        else:
+            time_match = time_match or hit
+        if date_match is not None and time_match is not None:
+            break
 
     if date_match:
-        logger.info(f"due_parse date_match: day={date_match.group(1)} month={date_match.group(2)} year_part={date_match.group(3)}")
+        logger.debug(
+            "due_parse date_match: day=%s month=%s year_part=%s",
+            date_match.group("day"),
+            date_match.group("month"),
+            date_match.group("year"),
+        )
     else:
-        logger.info("due_parse no date match")
-    
+        logger.debug("due_parse no date match")
+
     if time_match:
-        logger.info(f"due_parse time_match: hour={time_match.group(1)} minute={time_match.group(2)}")
+        logger.debug(
+            "due_parse time_match: hour=%s minute=%s",
+            time_match.group("hour"),
+            time_match.group("minute"),
+        )
     else:
-        logger.info("due_parse no time match")
+        logger.debug("due_parse no time match")
 
     now = datetime.now(tz) if tz else datetime.now(timezone.utc)
 
     parsed_hour = DEFAULT_DUE_HOUR
     parsed_minute = DEFAULT_DUE_MINUTE
     if time_match:
-        parsed_hour = int(time_match.group(1))
-        parsed_minute = int(time_match.group(2))
+        parsed_hour = int(time_match.group("hour"))
+        parsed_minute = int(time_match.group("minute"))
 
     if date_match:
-        day = int(date_match.group(1))
-        month = int(date_match.group(2))
-        year_part = date_match.group(3)
+        day = int(date_match.group("day"))
+        month = int(date_match.group("month"))
+        year_part = date_match.group("year")
 
         if year_part is None:
             year = now.year
@@ -158,7 +221,7 @@ def _parse_due_datetime(text: str, tz) -> Optional[datetime]:
             logger.info("due_parse invalid date components")
             return None
         dt_final = dt.replace(tzinfo=tz) if tz else dt.replace(tzinfo=timezone.utc)
-        logger.info(f"due_parse result date+time -> {dt_final.isoformat()}")
+        logger.info("due_parse result date+time -> %s", dt_final.isoformat())
         return dt_final
 
     # No date provided, but time may be
@@ -166,7 +229,7 @@ def _parse_due_datetime(text: str, tz) -> Optional[datetime]:
         candidate = now.replace(hour=parsed_hour, minute=parsed_minute, second=0, microsecond=0)
         if candidate <= now:
             candidate = candidate + timedelta(days=1)
-        logger.info(f"due_parse result time-only -> {candidate.isoformat()}")
+        logger.info("due_parse result time-only -> %s", candidate.isoformat())
         return candidate
 
     logger.info("due_parse no result -> None")
@@ -196,7 +259,6 @@ def _create_google_task_sync(
     list_id: Optional[str] = None,
     due: Optional[datetime] = None,
 ) -> Dict[str, Any]:
-    svc = get_tasks_service()
     body: Dict[str, Any] = {"title": title}
     
     if due is not None:
@@ -210,19 +272,89 @@ def _create_google_task_sync(
         
     tasklist = list_id or "@default"
     
-    # Log what we're sending to Google Tasks API
-    logger.info(f"google_tasks_request: tasklist={tasklist} body={body}")
+    # Log full request payload only when someone is actually debugging
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("google_tasks_request: tasklist=%s body=%s", tasklist, body)
     
-    created: Dict[str, Any] = (
-        svc.tasks().insert(tasklist=tasklist, body=body).execute()
-    )
+    with _tasks_service_lock:
+        svc = get_tasks_service()
+        created: Dict[str, Any] = (
+            svc.tasks().insert(tasklist=tasklist, body=body).execute()
+        )
     
-    # Log what Google Tasks API returns
-    logger.info(f"google_tasks_response: {created}")
+    # Log full response payload only when someone is actually debugging
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("google_tasks_response: %s", created)
     
     return created
 
 
+# Micro-batching for task creation: each "משימה חדשה" pays for a thread hop,
+# so concurrent requests enqueue their payloads and one worker drains the
+# queue, running the whole batch on a single worker thread with the shared
+# service client.
+_task_queue: Optional["asyncio.Queue[tuple[tuple, asyncio.Future]]"] = None
+_task_worker: Optional["asyncio.Task"] = None
+
+
+def _run_task_batch_sync(batch_args: list) -> list:
+    """Create a batch of Google Tasks on one worker thread.
+
+    Returns one outcome per input: the created task dict, or the exception
+    raised for that item (failures must not poison the rest of the batch).
+    """
+    outcomes: list = []
+    for args in batch_args:
+        try:
+            outcomes.append(_create_google_task_sync(*args))
+        except Exception as e:  # noqa: BLE001 - reported per item
+            outcomes.append(e)
+    return outcomes
+
+
+async def _task_creation_worker() -> None:
+    assert _task_queue is not None
+    while True:
+        batch = [await _task_queue.get()]
+        # Drain whatever else arrived while we were idle
+        while True:
+            try:
+                batch.append(_task_queue.get_nowait())
+            except asyncio.QueueEmpty:
+                break
+        if len(batch) > 1:
+            logger.info("Creating %d Google Tasks in one batch", len(batch))
+        outcomes = await asyncio.to_thread(
+            _run_task_batch_sync, [args for args, _ in batch]
+        )
+        for (_, future), outcome in zip(batch, outcomes):
+            if future.cancelled():
+                continue
+            if isinstance(outcome, Exception):
+                future.set_exception(outcome)
+            else:
+                future.set_result(outcome)
+        for _ in batch:
+            _task_queue.task_done()
+
+
+async def create_google_task(
+    title: str,
+    notes: Optional[str] = None,
+    list_id: Optional[str] = None,
+    due: Optional[datetime] = None,
+) -> Dict[str, Any]:
+    """Enqueue a task creation and await its result."""
+    global _task_queue, _task_worker
+    if _task_queue is None:
+        _task_queue = asyncio.Queue()
+    if _task_worker is None or _task_worker.done():
+        _task_worker = asyncio.create_task(_task_creation_worker())
+    future: asyncio.Future = asyncio.get_running_loop().create_future()
+    _task_queue.put_nowait(((title, notes, list_id, due), future))
+    return await future
+
+
 class IntentEnum(str, Enum):
     summarize = "summarize"
     ask_question = "ask_question"
@@ -233,12 +365,46 @@ class IntentEnum(str, Enum):
     other = "other"
 
 
+# Intent trigger phrases - single source of truth for the combined matcher
+INTENT_KEYWORDS: dict[IntentEnum, tuple[str, ...]] = {
+    IntentEnum.tag_all: ("@כולם", "@everyone"),
+    IntentEnum.summarize: ("סיכום", "daily summary", "summarize"),
+    IntentEnum.task: ("משימה חדשה",),
+}
+
+# Combined multi-pattern matcher built once at import: a single pass over the
+# message finds every trigger present (named group = intent name); routing
+# priority is applied afterwards
+INTENT_RE = re.compile(
+    "|".join(
+        f"(?P<{intent.name}>{'|'.join(map(re.escape, phrases))})"
+        for intent, phrases in INTENT_KEYWORDS.items()
+    ),
+    re.IGNORECASE,
+)
+
+
 class Intent(BaseModel):
     intent: IntentEnum = Field(
         description="The intent of the user's message"
     )
 
 
+# Any Hebrew letter marks the request as Hebrew for prompt specialization
+HEBREW_RE = re.compile("[\\u0590-\\u05FF]")
+
+
+def _detect_language(text: str) -> str:
+    """Best-effort language hint for the summary prompt."""
+    return "Hebrew" if HEBREW_RE.search(text) else "English"
+
+
+# Summaries being generated right now, keyed by chat JID. Routers are created
+# per request, so this lives at module level: concurrent summarize requests for
+# the same chat piggyback on one LLM call instead of each paying for their own.
+_pending_summaries: dict[str, "asyncio.Task[str]"] = {}
+
+
 class Router(BaseHandler):
     def __init__(
         self,
@@ -250,13 +416,28 @@ class Router(BaseHandler):
             session, whatsapp, embedding_client
         )
         super().__init__(session, whatsapp, embedding_client)
+        # Intent dispatch table: one dict lookup instead of a match/case chain
+        self._intent_handlers = {
+            IntentEnum.admin_only: self.admin_only,
+            IntentEnum.summarize: self.summarize,
+            IntentEnum.ask_question: self.ask_knowledge_base,
+            IntentEnum.about: self.about,
+            IntentEnum.tag_all: self.tag_all_participants,
+            IntentEnum.task: self.task,
+            IntentEnum.other: self.default_response,
+        }
 
     async def _route(self, message: str, allow_command_execution: bool = False) -> IntentEnum:
         """Route message to appropriate handler based on content"""
-        message_lower = message.lower()
+        # Single scan collects every trigger present; priority is decided below
+        matched: set[str | None] = set()
+        for hit in INTENT_RE.finditer(message):
+            matched.add(hit.lastgroup)
+            if hit.lastgroup == "tag_all":
+                break  # Highest priority - no need to keep scanning
 
         # Check for tag_all intent (@כולם) - everyone can use it
-        if any(phrase in message_lower for phrase in ["@כולם", "@everyone"]):
+        if "tag_all" in matched:
             logger.info("Routing to tag_all")
             return IntentEnum.tag_all
 
@@ -265,19 +446,19 @@ class Router(BaseHandler):
             logger.info("Admin-only: rejecting non-admin request")
             return IntentEnum.admin_only
 
-        logger.info(f"route msg_preview='{message[:60]}'")
-        
+        logger.info("route msg_preview='%s'", message[:60])
+
         # Check for summarize intent
-        if any(phrase in message_lower for phrase in ["סיכום", "daily summary", "summarize"]):
+        if "summarize" in matched:
             logger.info("Routing to summarize")
             return IntentEnum.summarize
-            
+
         # Check for task intent (trigger phrase appears anywhere)
         # Already checked in __init__ if it's a task command and if admin only
-        if "משימה חדשה" in message:
+        if "task" in matched:
             logger.info("Routing to task")
             return IntentEnum.task
-            
+
         # Default to ask_question for everything else
         logger.info("Routing to ask_question (default)")
         return IntentEnum.ask_question
@@ -285,7 +466,10 @@ class Router(BaseHandler):
     async def __call__(self, message: Message, allow_command_execution: bool = False):
         """Route message to appropriate handler"""
         logger.info(
-            f"router sender={message.sender_jid} chat={message.chat_jid} text_len={(len(message.text) if message.text else 0)}"
+            "router sender=%s chat=%s text_len=%d",
+            message.sender_jid,
+            message.chat_jid,
+            len(message.text) if message.text else 0,
         )
         
         # Ensure message.text is not None before routing
@@ -294,37 +478,20 @@ class Router(BaseHandler):
             return
             
         route = await self._route(message.text, allow_command_execution)
-        logger.info(f"router intent={route}")
-        
-        match route:
-            case IntentEnum.admin_only:
-                logger.info("router -> admin_only")
-                await self.admin_only(message)
-                logger.info("Admin only handler completed")
-            case IntentEnum.summarize:
-                logger.info("router -> summarize")
-                await self.summarize(message)
-                logger.info("Summarize handler completed")
-            case IntentEnum.ask_question:
-                logger.info("router -> ask_knowledge_base")
-                await self.ask_knowledge_base(message)
-                logger.info("Knowledge base handler completed")
-            case IntentEnum.about:
-                logger.info("router -> about")
-                await self.about(message)
-                logger.info("About handler completed")
-            case IntentEnum.tag_all:
-                logger.info("router -> tag_all_participants")
-                await self.tag_all_participants(message)
-                logger.info("Tag all participants handler completed")
-            case IntentEnum.task:
-                logger.info("router -> task")
-                await self.task(message)
-                logger.info("Task handler completed")
-            case IntentEnum.other:
-                logger.info("router -> default_response")
-                await self.default_response(message)
-                logger.info("Default response handler completed")
+        logger.info("router intent=%s", route)
+
+        handler = self._intent_handlers.get(route, self.default_response)
+        try:
+            # Bound each handler so a stuck LLM or API call can't wedge the
+            # webhook worker indefinitely
+            async with asyncio.timeout(HANDLER_TIMEOUT_SECONDS):
+                logger.info("router -> %s", route.value)
+                await handler(message)
+                logger.info("%s handler completed", route.value)
+        except TimeoutError:
+            logger.error(
+                f"Handler for intent={route} timed out after {HANDLER_TIMEOUT_SECONDS}s"
+            )
 
     async def admin_only(self, message: Message):
         logger.info("admin_only start")
@@ -337,19 +504,74 @@ class Router(BaseHandler):
 
     async def summarize(self, message: Message):
         logger.info("summarize start")
-        today_start = datetime.combine(date.today(), datetime.min.time())
-        my_jid = await self.whatsapp.get_my_jid()
+        pending = _pending_summaries.get(message.chat_jid)
+        if pending is None:
+            pending = asyncio.create_task(
+                self._generate_summary(
+                    message.chat_jid, _detect_language(message.text or "")
+                )
+            )
+            _pending_summaries[message.chat_jid] = pending
+            pending.add_done_callback(
+                lambda _task, chat_jid=message.chat_jid: _pending_summaries.pop(chat_jid, None)
+            )
+        else:
+            logger.info("summarize piggybacking on in-flight summary for %s", message.chat_jid)
+
+        # Shield the shared task: cancelling one waiter (handler timeout,
+        # client disconnect) must abandon its wait, not kill the generation
+        # every other piggybacked waiter is awaiting
+        response_text = await asyncio.shield(pending)
+        logger.info("summarize sending len=%d", len(response_text))
 
+        # Check if response is too long (WhatsApp has a limit of ~4096 characters)
+        if len(response_text) > MAX_RESPONSE_CHARS:
+            logger.warning(
+                "Response too long (%d chars), truncating to %d chars",
+                len(response_text),
+                MAX_RESPONSE_CHARS,
+            )
+            response_text = response_text[:MAX_RESPONSE_CHARS] + TRUNCATION_NOTICE
+
+        await self.send_message(
+            message.chat_jid,
+            response_text,
+            message.message_id,
+        )
+        logger.info("summarize end")
+
+    async def _generate_summary(self, chat_jid: str, language: str = "English") -> str:
+        """Query today's history for a chat and run the summary agent.
+
+        language specializes the prompt to the requester's language instead of
+        asking the model to infer it from the request.
+        """
+        today_start = datetime.combine(date.today(), MIDNIGHT)
+        my_jid_normalized = await self.whatsapp.get_my_jid_normalized()
+
+        # Select only the columns chat2text needs: skips hydrating full Message
+        # instances and the selectin eager loads of sender/group per row
         stmt = (
-            select(Message)
-            .where(Message.chat_jid == message.chat_jid)  # From the same group
+            select(Message.timestamp, Message.sender_jid, Message.text)
+            .where(Message.chat_jid == chat_jid)  # From the same group
             .where(Message.timestamp >= today_start)  # From today
-            .where(Message.sender_jid != my_jid.normalize_str())  # Exclude self messages
+            .where(Message.sender_jid != my_jid_normalized)  # Exclude self messages
             .order_by(desc(Message.timestamp))  # Newest to oldest
             .limit(MAX_MESSAGES_FOR_CONTEXT)
         )
         res = await self.session.exec(stmt)
-        messages_to_summarize: list[Message] = list(res.all())
+        messages_to_summarize = list(res.all())
+
+        # DESC + LIMIT picks the newest rows; reverse in Python (cheap, no DB
+        # re-sort) so the model reads the conversation in chronological order
+        messages_to_summarize.reverse()
+
+        # Format the history in a worker thread while the agent is being
+        # built: chat2text is pure CPU and would otherwise block the loop.
+        # The char budget is enforced during formatting, newest lines kept.
+        history_task = asyncio.create_task(
+            asyncio.to_thread(chat2text, messages_to_summarize, MAX_HISTORY_CHARS)
+        )
 
         agent = Agent(
             model=SUMMARIZE_MODEL,
@@ -375,36 +597,35 @@ class Router(BaseHandler):
             - Tag users with @number when mentioning them
             - Use *bold* for headers, _italic_ for quotes, emojis for organization
             - Keep response under 3000 characters
-            - Respond in the same language as the request
+            - Respond in {language}
             """,
         )
 
-        # Compose bounded input for the LLM (history only)
-        history_text_full = chat2text(messages_to_summarize)
-        history_text = history_text_full[:MAX_HISTORY_CHARS]
-
-        response = await agent.run(
+        # Bounded input for the LLM (history only), already capped by chat2text
+        history_text = await history_task
+
+        # Stream the response so generation can stop as soon as the WhatsApp
+        # size cap is reached, instead of paying for tokens that would be
+        # truncated anyway. Partial messages are not sent to the chat - there
+        # is no way to edit a WhatsApp message in place while streaming, so
+        # incremental sends would just spam the group.
+        chunks: list[str] = []
+        total_chars = 0
+        async with agent.run_stream(
             f"# History (truncated):\n{history_text}"
-        )
-
-        # If pydantic_ai provides usage info
-        if hasattr(response, 'usage'):
-            logger.info(f"Tokens used: {response.usage}")
-
-        response_text = response.output
-        logger.info(f"summarize sending len={len(response_text)}")
-        
-        # Check if response is too long (WhatsApp has a limit of ~4096 characters)
-        if len(response_text) > 4000:
-            logger.warning(f"Response too long ({len(response_text)} chars), truncating to 4000 chars")
-            response_text = response_text[:4000] + "...\n\n[Response truncated due to length]"
-        
-        await self.send_message(
-            message.chat_jid,
-            response_text,
-            message.message_id,
-        )
-        logger.info("summarize end")
+        ) as result:
+            async for chunk in result.stream_text(delta=True):
+                chunks.append(chunk)
+                total_chars += len(chunk)
+                if total_chars >= MAX_RESPONSE_CHARS:
+                    logger.info(
+                        "summary hit %d chars mid-stream, stopping early",
+                        total_chars,
+                    )
+                    break
+            logger.info("Tokens used: %s", result.usage())
+
+        return "".join(chunks)
 
     async def about(self, message: Message):
         await self.send_message(
@@ -435,16 +656,23 @@ class Router(BaseHandler):
                 list_id = None
             list_id = list_id or "@default"
 
-            # Build notes using group name and sender name/phone
-            group_name: str
-            if message.group_jid:
-                grp = await self.session.get(Group, message.group_jid)
-                group_name = grp.group_name if (grp and grp.group_name) else message.chat_jid
-            else:
-                group_name = message.chat_jid
-
-            snd = await self.session.get(Sender, message.sender_jid)
-            sender_display = (snd.push_name if (snd and snd.push_name) else parse_jid(message.sender_jid).user)
+            # Build notes using group name and sender name/phone; both display
+            # fields come back as scalar subqueries in a single round-trip
+            # instead of two sequential session.get calls
+            group_name_sq = (
+                select(Group.group_name)
+                .where(Group.group_jid == message.group_jid)
+                .scalar_subquery()
+            )
+            push_name_sq = (
+                select(Sender.push_name)
+                .where(Sender.jid == message.sender_jid)
+                .scalar_subquery()
+            )
+            res = await self.session.exec(select(group_name_sq, push_name_sq))
+            group_name, push_name = res.one()
+            group_name = group_name or message.chat_jid
+            sender_display = push_name or parse_jid(message.sender_jid).user
 
             notes = f"Group: {group_name}\nSender: {sender_display}"
 
@@ -454,18 +682,12 @@ class Router(BaseHandler):
             if not due_dt:
                 today_local = datetime.now(tz)
                 next_day = (today_local + timedelta(days=1)).date()
-                due_dt = datetime.combine(next_day, time(hour=DEFAULT_DUE_HOUR, minute=DEFAULT_DUE_MINUTE)).replace(tzinfo=tz)
+                due_dt = datetime.combine(next_day, DEFAULT_DUE_TIME).replace(tzinfo=tz)
 
             logger.info(f"Creating Google Task: title='{title}', list='{list_id}'")
 
-            # Run blocking Google API call in a thread
-            created = await asyncio.to_thread(
-                _create_google_task_sync,
-                title,
-                notes,
-                list_id,
-                due_dt,
-            )
+            # Runs via the batching queue; blocking API work stays on a thread
+            created = await create_google_task(title, notes, list_id, due_dt)
 
 
             # Format due date for display
@@ -508,56 +730,44 @@ class Router(BaseHandler):
     async def tag_all_participants(self, message: Message):
         """Tag all participants in the group when @כולם is mentioned"""
         try:
-            # Get bot's phone number to exclude it
-            my_jid = await self.whatsapp.get_my_jid()
-            bot_phone = my_jid.user
-            logger.info(f"Bot phone: {bot_phone}")
-            
-            # Get all groups - single attempt only
-            from src.handler import get_user_groups
-            groups_response = await get_user_groups(self.whatsapp)
-            
-            # Add null check for results
-            if not groups_response.results or not groups_response.results.data:
-                logger.info("No groups data found")
-                await self.send_message(message.chat_jid, "📢 כולם מוזמנים!", message.message_id)
-                return
-            
-            # Find the target group first
-            target_group = next(
-                (group for group in groups_response.results.data if group.JID == message.chat_jid),
-                None
+            # Bot JID and group lookup are independent - fetch them
+            # concurrently; the group comes from the cached JID index (O(1))
+            # instead of a scan over the full group list
+            my_jid, target_group = await asyncio.gather(
+                self.whatsapp.get_my_jid(),
+                get_group_by_jid(self.whatsapp, message.chat_jid),
             )
-            
+            bot_phone = my_jid.user
+            logger.info("Bot phone: %s", bot_phone)
+
+
             if target_group:
-                logger.info(f"Found target group with {len(target_group.Participants)} participants")
-                
-                # Tag everyone except the bot
-                tagged_message = ""
-                for participant in target_group.Participants:
-                    logger.info(f"Processing participant: {participant.JID}")
-                    
-                    # Extract phone number using our helper function
-                    from src.handler import extract_phone_from_participant
-                    phone = extract_phone_from_participant(participant)
-                    logger.info(f"Got phone: {phone} for JID: {participant.JID}")
-                    
-                    # Only tag if we have a real phone number and it's not the bot
-                    if phone and phone != bot_phone:
-                        tagged_message += f"@{phone} "
-                        logger.info(f"Added to tagged message: @{phone}")
-                
-                logger.info(f"Tagged message so far: '{tagged_message}'")
-                
+                logger.info("Found target group with %d participants", len(target_group.Participants))
+
+                # Short-circuit groups with nobody to tag
+                if not target_group.Participants:
+                    logger.info("No participants in target group, using fallback message")
+                    await self.send_message(message.chat_jid, "כולם מוזמנים! 🎉", message.message_id)
+                    return
+
+                # Tag everyone except the bot: one pass over the participant
+                # records extracts the phone field and filters, and the list
+                # is joined once instead of O(P) string concatenation
+                tags = [
+                    f"@{phone}"
+                    for participant in target_group.Participants
+                    if (phone := extract_phone_from_participant(participant))
+                    and phone != bot_phone
+                ]
+                logger.debug("Extracted %d taggable phones", len(tags))
+
                 # If no phone numbers found, just use the fallback message
-                if not tagged_message.strip():
+                if not tags:
                     logger.info("No participants tagged, will use fallback message")
-                
-                logger.info(f"Final tagged message: '{tagged_message}'")
-                
+
                 # Send either the tagged message or fallback
-                response_text = tagged_message.strip() or "כולם מוזמנים! 🎉"
-                logger.info(f"tag_all sending len={len(response_text)}")
+                response_text = " ".join(tags) or "כולם מוזמנים! 🎉"
+                logger.info("tag_all sending len=%d", len(response_text))
                 await self.send_message(message.chat_jid, response_text, message.message_id)
                 return
             else:
@@ -5,8 +5,9 @@ from .base_handler import BaseHandler
 from pydantic_ai import Agent
 from pydantic import BaseModel
 from sqlmodel import Field
-from models import Message
-from whatsapp.jid import parse_jid
+from src.models import Message
+from src.models.group import Group
+from src.whatsapp.jid import parse_jid
 
 # Creating an object
 logger = logging.getLogger(__name__)
@@ -20,6 +21,15 @@ class WhatsappGroupLinkSpamHandler(BaseHandler):
         explanation: str = Field(max_length=100, description="Short explanation")
 
     async def __call__(self, message: Message):
+        # Message no longer eager-loads its group; fetch it explicitly
+        group: Group | None = (
+            await self.session.get(Group, message.group_jid)
+            if message.group_jid
+            else None
+        )
+        if group is None or not group.owner_jid:
+            raise ValueError("Group owner JID is required")
+
         agent = Agent(
             model="anthropic:claude-4-sonnet-20250514",
             system_prompt="""You are a spam whatsapp link spam detector. You are given a message and you need to return a score of 1-5 and a SHORT 7 words explanation of why you gave that score.
@@ -32,18 +42,15 @@ class WhatsappGroupLinkSpamHandler(BaseHandler):
             (
                 f"@{parse_jid(message.sender_jid).user}:"
                 f"{message.text}"
-                f"The message is from a group chat. The group name is {message.group.group_name} and the group description is {message.group.group_topic}"
+                f"The message is from a group chat. The group name is {group.group_name} and the group description is {group.group_topic}"
             )
         )
 
         spam_result = response.output
 
-        if message and message.group and not message.group.owner_jid:
-            raise ValueError("Group owner JID is required")
-
         # Construct message with validated data
         message_to_send = (
-            f"@{message.group.owner_jid.split('@')[0]} - A Whatsapp group link was shared in the group. "  # type: ignore
+            f"@{group.owner_jid.split('@')[0]} - A Whatsapp group link was shared in the group. "
             f"This might be a spam. Please check and remove if it is spam.\n\n"
             f"Spam Confidence Level: *{spam_result.score}*  (1 not spam - 5 spam) \n"
             f"Explanation: {spam_result.explanation}"
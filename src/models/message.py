@@ -60,12 +60,11 @@ class BaseMessage(SQLModel):
 
 
 class Message(BaseMessage, table=True):
-    sender: Optional["Sender"] = Relationship(
-        back_populates="messages", sa_relationship_kwargs={"lazy": "selectin"}
-    )
-    group: Optional["Group"] = Relationship(
-        back_populates="messages", sa_relationship_kwargs={"lazy": "selectin"}
-    )
+    # No implicit eager loading: every Message batch load paid two extra
+    # selectin queries for sender/group that almost no call site used. The few
+    # consumers that need the related rows fetch them explicitly.
+    sender: Optional["Sender"] = Relationship(back_populates="messages")
+    group: Optional["Group"] = Relationship(back_populates="messages")
     replies: List["Message"] = Relationship(
         sa_relationship_kwargs={
             "primaryjoin": "Message.message_id==foreign(Message.reply_to_id)",
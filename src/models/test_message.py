@@ -2,9 +2,9 @@ from datetime import datetime, timezone
 
 import pytest
 
-from models import Message
-from models.webhook import WhatsAppWebhookPayload, ExtractedMedia
-from test_utils.mock_session import mock_session  # noqa
+from src.models import Message
+from src.models.webhook import WhatsAppWebhookPayload, ExtractedMedia
+from src.test_utils.mock_session import mock_session  # noqa
 
 
 @pytest.mark.asyncio
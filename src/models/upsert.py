@@ -1,7 +1,7 @@
 from typing import List
 
 from sqlalchemy.dialects.postgresql import insert
-from sqlmodel import SQLModel, select
+from sqlmodel import SQLModel
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 
@@ -14,26 +14,18 @@ async def upsert(session: AsyncSession, entity: SQLModel):
     # Create insert statement
     stmt = insert(entity.__class__).values(**{**pkeys, **vals})
 
-    # Create on_conflict_do_update statement
+    # Create on_conflict_do_update statement; RETURNING hands back the
+    # inserted/updated row in the same round-trip instead of a follow-up SELECT
     stmt = stmt.on_conflict_do_update(
         index_elements=list(pkeys.keys()),  # Convert keys to list
         set_={
             k: stmt.excluded[k]  # Use excluded to reference values from INSERT
             for k in vals.keys()  # Only update non-primary key columns
         },
-    )
-
-    await session.exec(stmt)
-
-    # Query for the updated instance
-    select_stmt = select(entity.__class__).where(
-        *[getattr(entity.__class__, k) == v for k, v in pkeys.items()]
-    )
-    db_instance = await session.exec(select_stmt)
-    result = db_instance.first()
+    ).returning(entity.__class__)
 
-    # Merge the instance into the session
-    return result
+    result = await session.exec(stmt)
+    return result.scalars().first()
 
 
 async def bulk_upsert(session: AsyncSession, entities: List[SQLModel]):
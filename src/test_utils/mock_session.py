@@ -73,6 +73,17 @@ class AsyncQueryMock:
         return results[0] if results else None
 
 
+class ScalarResultMock:
+    def __init__(self, results):
+        self._results = results
+
+    def all(self):
+        return self._results
+
+    def first(self):
+        return self._results[0] if self._results else None
+
+
 class AsyncCompoundQueryMock:
     def __init__(self, storage):
         self._storage = storage
@@ -86,6 +97,10 @@ class AsyncCompoundQueryMock:
         results = await self.all()
         return results[0] if results else None
 
+    def scalars(self):
+        # Matches result.scalars().first() as used by the upsert RETURNING path
+        return ScalarResultMock(self._results)
+
 
 class AsyncSessionMock(MagicMock):
     def __init__(self, *args, **kwargs):
@@ -1,18 +1,44 @@
-from typing import List
+from typing import Iterable, Iterator, List, Optional, Sequence, Union
 
 from src.models import Message
 from src.whatsapp.jid import parse_jid
 
 
-def chat2text(history: List[Message]) -> str:
-    """Convert message history to readable text format for AI processing."""
-    formatted_messages = []
+def _format_lines(history: Iterable[Message]) -> Iterator[str]:
+    """Yield one formatted "[timestamp] @user: text" line per message."""
+    # A chat has few distinct senders; parse each JID once and reuse
+    usernames: dict[str, str] = {}
     for message in history:
-        # Format timestamp to be more readable
-        timestamp_str = message.timestamp.strftime("%Y-%m-%d %H:%M")
-        username = parse_jid(message.sender_jid).user
-        # Clean and format the message text
-        text = (message.text or "").strip()
-        formatted_messages.append(f"[{timestamp_str}] @{username}: {text}")
-    
-    return "\n".join(formatted_messages)
+        username = usernames.get(message.sender_jid)
+        if username is None:
+            username = parse_jid(message.sender_jid).user
+            usernames[message.sender_jid] = username
+        # One f-string formats timestamp, user, and cleaned text in place
+        yield f"[{message.timestamp:%Y-%m-%d %H:%M}] @{username}: {(message.text or '').strip()}"
+
+
+def chat2text(
+    history: Union[Sequence[Message], Iterable[Message]],
+    max_chars: Optional[int] = None,
+) -> str:
+    """Convert message history to readable text format for AI processing.
+
+    When max_chars is given, formatting stops once the budget is spent,
+    keeping the newest lines (history is expected oldest-first) - no full
+    text is built just to be sliced afterwards.
+    """
+    if max_chars is None:
+        return "\n".join(_format_lines(history))
+
+    # Walk from the newest message backwards, stop when the budget is spent,
+    # then restore chronological order
+    messages = history if isinstance(history, Sequence) else list(history)
+    lines: List[str] = []
+    total = 0
+    for line in _format_lines(reversed(messages)):
+        lines.append(line)
+        total += len(line) + 1  # +1 for the joining newline
+        if total >= max_chars:
+            break
+    lines.reverse()
+    return "\n".join(lines)
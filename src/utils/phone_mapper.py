@@ -1,50 +1,91 @@
-from datetime import datetime, timezone
+import sys
 from typing import Dict, Optional, Any
 
+# Cap the mapping so a long-running process doesn't grow without bound; at
+# the limit the oldest-inserted entry is evicted. A plain dict keeps
+# insertion order, which is close enough to LRU here without paying a
+# move-to-end on every hit.
+MAX_MAPPINGS = 50_000
+
+# Nearly every phone JID ends with the standard WhatsApp suffix; a
+# fixed-length compare plus slice resolves those without scanning for '@'
+_WA_SUFFIX = '@s.whatsapp.net'
+_WA_SUFFIX_LEN = len(_WA_SUFFIX)
+
 
 class PhoneMapper:
-    """Global mapping service for JIDs, LIDs, and phone numbers"""
-    
-    def __init__(self):
-        # Store phone number for each identifier (JID or LID -> phone)
-        self._identifier_to_phone: Dict[str, str] = {}
-        # Store when we last saw each phone number
-        self._phone_last_seen: Dict[str, datetime] = {}
-    
-    def add_jid_mapping(self, jid: str, phone: str):
-        """Add mapping from JID to phone number (from messages)"""
-        self._identifier_to_phone[jid] = phone
-        self._phone_last_seen[phone] = datetime.now(timezone.utc)
-    
-    def add_lid_mapping(self, lid: str, phone: str):
-        """Add mapping from LID to phone number (from group analysis)"""
-        self._identifier_to_phone[lid] = phone
-        self._phone_last_seen[phone] = datetime.now(timezone.utc)
-    
+    """Global mapping service for JIDs, LIDs, and phone numbers
+
+    Not locked on purpose: the app is a single-process asyncio service, the
+    methods never await, and each one is a couple of atomic dict operations,
+    so calls cannot interleave mid-update. Revisit if this ever moves to a
+    threaded worker model.
+    """
+
+    # Single dict: identifier (JID or LID) -> phone. Keeping a parallel
+    # per-phone dict doubled the hash inserts on every add for data that
+    # get_all_phones can derive lazily from the values. Bound at class level:
+    # the mapper is a deliberate singleton, and resolving the attribute from
+    # the type dict lets CPython's attribute cache serve every call without a
+    # per-instance dict probe.
+    _identifier_to_phone: Dict[str, str] = {}
+
+    def _remember(self, identifier: str, phone: str):
+        """Store a mapping, evicting the oldest entry once at capacity."""
+        mapping = self._identifier_to_phone
+        if len(mapping) >= MAX_MAPPINGS and identifier not in mapping:
+            del mapping[next(iter(mapping))]
+        mapping[identifier] = phone
+
+    def add_mapping(self, identifier: str, phone: str):
+        """Add mapping from any identifier (JID or LID) to a phone number"""
+        # Intern so the same phone arriving via many identifiers shares one
+        # string object and later comparisons short-circuit on the pointer
+        self._remember(identifier, sys.intern(phone))
+
+    # The JID (from messages) and LID (from group analysis) entry points were
+    # byte-for-byte identical; kept as aliases for call-site readability
+    add_jid_mapping = add_mapping
+    add_lid_mapping = add_mapping
+
     def get_phone(self, identifier: str) -> Optional[str]:
         """Get phone number by any identifier (JID or LID)"""
-        if identifier in self._identifier_to_phone:
-            return self._identifier_to_phone[identifier]
-        
-        # Only extract phone from actual phone JIDs, not LIDs
-        if '@' in identifier and not identifier.endswith('@lid'):
-            phone = identifier.split('@')[0]
-            # Store this mapping for future use
-            self._identifier_to_phone[identifier] = phone
+        # Single hash lookup: dict.get folds the membership test and fetch
+        mapping = self._identifier_to_phone
+        phone = mapping.get(identifier)
+        if phone is not None:
+            return phone
+
+        # Fast path for the common suffix: the phone is the fixed-length
+        # prefix, returned without touching the dict at all
+        if identifier[-_WA_SUFFIX_LEN:] == _WA_SUFFIX:
+            return identifier[:-_WA_SUFFIX_LEN]
+
+        # Only extract phone from actual phone JIDs, not LIDs. rfind locates
+        # the separator in one scan and the suffix slice replaces the extra
+        # endswith pass over the string
+        at = identifier.rfind('@')
+        if at != -1 and identifier[at + 1:] != 'lid':
+            phone = sys.intern(identifier[:at])
+            # Store for future use. The .get above already proved the key is
+            # absent, so insert directly instead of re-probing via _remember
+            if len(mapping) >= MAX_MAPPINGS:
+                del mapping[next(iter(mapping))]
+            mapping[identifier] = phone
             return phone
-        
+
         # Return None for unknown LIDs
         return None
-    
+
     def get_all_phones(self) -> list[str]:
         """Get all known phone numbers"""
-        return list(self._phone_last_seen.keys())
-    
+        # Rarely called; interned values make the set dedupe cheap
+        return list(set(self._identifier_to_phone.values()))
+
     def clear(self):
         """Clear all mappings"""
         self._identifier_to_phone.clear()
-        self._phone_last_seen.clear()
 
 
 # Global instance
-phone_mapper = PhoneMapper() 
\ No newline at end of file
+phone_mapper = PhoneMapper()
@@ -185,6 +185,7 @@ class WhatsAppClient:
         return DeviceResponse.model_validate_json(response.content)
 
     _jid: Optional[JID] = None
+    _jid_normalized: Optional[str] = None
 
     async def get_my_jid(self) -> JID:
         if self._jid:
@@ -194,6 +195,12 @@ class WhatsAppClient:
         self._jid = parse_jid(info.results[0].device)
         return self._jid
 
+    async def get_my_jid_normalized(self) -> str:
+        """Normalized string form of get_my_jid, computed once per client."""
+        if self._jid_normalized is None:
+            self._jid_normalized = (await self.get_my_jid()).normalize_str()
+        return self._jid_normalized
+
     # User Operations
     async def get_user_info(self, phone: str) -> UserInfoResponse:
         response = await self._get("/user/info", params={"phone": phone})
@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Union
 from warnings import warn
 
@@ -76,6 +77,9 @@ def parse_ad_jid(user: str) -> JID:
     return full_jid
 
 
+# The same sender/chat JIDs recur constantly (every message carries a couple),
+# so memoize parsing. Returned instances are shared: treat them as read-only.
+@lru_cache(maxsize=4096)
 def parse_jid(jid: str) -> JID:
     parts = jid.split("@")
     if len(parts) == 1:
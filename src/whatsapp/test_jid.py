@@ -1,6 +1,6 @@
 import pytest
 
-from whatsapp.jid import (
+from src.whatsapp.jid import (
     JID,
     JIDParseError,
     new_ad_jid,